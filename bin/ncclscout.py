@@ -12,9 +12,10 @@ import subprocess
 import os
 import sys
 import shutil
-import concurrent.futures
-import uuid
-from threading import Lock
+import math
+import re
+import asyncio
+import tempfile
 import argparse
 import itertools
 
@@ -34,13 +35,23 @@ COLOR_RESET = '\033[0m'
 # Log files and backup directory
 NCCL_LOG_FILE = 'nccl_test.log'
 
+# SSH multiplexing options: the first connection to a host sets up a control
+# channel that later reachability/shape calls reuse, skipping TCP+auth setup.
+SSH_OPTS = ['-o', 'ControlMaster=auto', '-o', 'ControlPath=/tmp/cm-%r@%h:%p', '-o', 'ControlPersist=60s', '-o', 'ConnectTimeout=5']
+
+# Matches an NCCL result row (leading size/count columns); group 1 is the
+# busbw value, i.e. the second-to-last column.
+_BW_RE = re.compile(r'^\s*\d+\s+\d+\s.*?(\d+(?:\.\d+)?)\s+\S+\s*$', re.MULTILINE)
+
 # Ensure the NCCL scripts are executable
 def ensure_scripts_executable():
     for config in GPU_SHAPES.values():
         script = config["script"]
         try:
-            subprocess.run(['chmod', '+x', script], check=True)
-        except subprocess.CalledProcessError as e:
+            mode = os.stat(script).st_mode
+            if mode | 0o111 != mode:
+                os.chmod(script, mode | 0o111)
+        except OSError as e:
             print(f"Error setting executable permission for {script}: {e}")
 
 # Copy the node ordering script if the shape is A100
@@ -81,103 +92,160 @@ def get_hosts_from_file(filename):
         return []
 
 # Check if a host is reachable via SSH
-def check_host_reachability(host):
-    try:
-        subprocess.check_call(['ssh', '-o', 'ConnectTimeout=5', host, 'exit'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except subprocess.CalledProcessError:
+async def check_host_reachability(host):
+    proc = await asyncio.create_subprocess_exec(
+        'ssh', *SSH_OPTS, host, 'exit',
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+    await proc.wait()
+    if proc.returncode != 0:
         print(f"Host {host} is unreachable.")
         return False
+    return True
 
-def check_hosts_concurrently(hosts, max_workers=10):
-    reachable_hosts = []
+async def check_hosts_concurrently(hosts, max_workers=10):
+    semaphore = asyncio.Semaphore(max_workers)
 
-    def check_and_return(host):
-        if check_host_reachability(host):
-            return host
-        return None
+    async def check(host):
+        async with semaphore:
+            return await check_host_reachability(host)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(check_and_return, host): host for host in hosts}
+    outcomes = await asyncio.gather(*(check(host) for host in hosts), return_exceptions=True)
 
-        for future in concurrent.futures.as_completed(futures):
-            host = futures[future]
-            try:
-                result = future.result()
-                if result:
-                    reachable_hosts.append(result)
-            except Exception as e:
-                print(f"Error checking host {host}: {e}")
+    reachable_hosts = []
+    for host, outcome in zip(hosts, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error checking host {host}: {outcome}")
+        elif outcome:
+            reachable_hosts.append(host)
 
     return reachable_hosts
 
-# Fetch the GPU shape from the remote node.
-def get_remote_node_shape(node):
+# Fetch the GPU shape for all hosts with a single pdsh fan-out and return a {host: shape} dict.
+# Falls back to per-host SSH threads when pdsh is not installed.
+async def get_remote_node_shapes(hosts):
+    hosts = list(dict.fromkeys(hosts))
+
+    if shutil.which('pdsh') is None:
+        return await fetch_shapes_concurrently(hosts)
+
+    curl_cmd = 'curl -sH "Authorization: Bearer Oracle" -L http://169.254.169.254/opc/v2/instance/ | jq -r .shape'
     try:
-        cmd = (
-            f'ssh {node} '
-            f'"curl -sH \\"Authorization: Bearer Oracle\\" -L http://169.254.169.254/opc/v2/instance/ | jq -r .shape"'
-        )
-        return subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error fetching node shape from {node}: {e}")
+        proc = await asyncio.create_subprocess_exec(
+            'pdsh', '-R', 'ssh', '-w', ','.join(hosts), curl_cmd,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        stdout, _ = await proc.communicate()
+    except OSError as e:
+        print(f"Error running pdsh, falling back to SSH: {e}")
+        return await fetch_shapes_concurrently(hosts)
+
+    shapes = {}
+    for line in stdout.decode('utf-8').splitlines():
+        if ': ' in line:
+            host, shape = line.split(': ', 1)
+            shapes[host.strip()] = shape.strip()
+
+    _shape_cache.update(shapes)
+
+    # Hosts pdsh could not reach still need an entry so callers can detect them.
+    for host in hosts:
+        if host not in shapes:
+            print(f"Error fetching node shape from {host} via pdsh.")
+            shapes[host] = None
+
+    return shapes
+
+# Fetch the GPU shape for each host concurrently and return a {host: shape} dict.
+async def fetch_shapes_concurrently(hosts, max_workers=16):
+    unique_hosts = list(dict.fromkeys(hosts))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(host):
+        async with semaphore:
+            return await get_remote_node_shape(host)
+
+    outcomes = await asyncio.gather(*(fetch(host) for host in unique_hosts), return_exceptions=True)
+
+    shapes = {}
+    for host, outcome in zip(unique_hosts, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error fetching shape for host {host}: {outcome}")
+            shapes[host] = None
+        else:
+            shapes[host] = outcome
+
+    return shapes
+
+# Shapes already fetched this run, so each host pays the SSH round-trip at
+# most once. A plain dict rather than lru_cache because the function is
+# async (lru_cache would hand back an already-awaited coroutine).
+_shape_cache = {}
+
+# Fetch the GPU shape from the remote node.
+async def get_remote_node_shape(node):
+    if node in _shape_cache:
+        return _shape_cache[node]
+
+    curl_cmd = 'curl -sH "Authorization: Bearer Oracle" -L http://169.254.169.254/opc/v2/instance/ | jq -r .shape'
+    proc = await asyncio.create_subprocess_exec(
+        'ssh', *SSH_OPTS, node, curl_cmd,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+    stdout, _ = await proc.communicate()
+    if proc.returncode != 0:
+        print(f"Error fetching node shape from {node}: ssh exited with {proc.returncode}")
         return None
 
+    shape = stdout.decode('utf-8').strip()
+    _shape_cache[node] = shape
+    return shape
+
+# Reverse index over GPU_SHAPES so shape lookups are a single dict hit.
+_SHAPE_INDEX = {shape: (model, config["threshold"], config["script"])
+                for model, config in GPU_SHAPES.items()
+                for shape in config["shapes"]}
+
 # Determine GPU model, threshold, and NCCL script based on node shape.
 def determine_gpu_model(shape):
-    for model, config in GPU_SHAPES.items():
-        if shape in config["shapes"]:
-            return model, config["threshold"], config["script"]
-    print(f"Error: Unrecognized shape '{shape}'.")
-    return None, None, None
-
-# Write a temporary hosts file with two nodes.
-def write_hosts_file(host1, host2):
-    filename = f"hosts_{uuid.uuid4().hex}.txt"
-    with open(filename, 'w') as f:
-        f.write(f"{host1}\n{host2}\n")
-    return filename
+    try:
+        return _SHAPE_INDEX[shape]
+    except KeyError:
+        print(f"Error: Unrecognized shape '{shape}'.")
+        return None, None, None
 
 # Run the NCCL test between two nodes.
-def run_nccl_test(host1, host2, nccl_script, timeout=120):
-    hosts_file = write_hosts_file(host1, host2)
-    cmd = ['timeout', str(timeout), nccl_script, '1', hosts_file]
-
+async def run_nccl_test(host1, host2, nccl_script, timeout=120):
     try:
-        output = subprocess.check_output(cmd)
+        # The hosts file lives in the system tmpdir and is cleaned up by the
+        # context manager, so nothing is left behind even if we get killed.
+        with tempfile.NamedTemporaryFile('w', prefix='hosts_', suffix='.txt') as hosts_file:
+            hosts_file.write(f"{host1}\n{host2}\n")
+            hosts_file.flush()
+
+            proc = await asyncio.create_subprocess_exec(
+                'timeout', str(timeout), nccl_script, '1', hosts_file.name,
+                stdout=asyncio.subprocess.PIPE)
+            output, _ = await proc.communicate()
+
+        if proc.returncode == 124:
+            print(f"Error: NCCL test timed out for pair {host1} and {host2}.")
+            return None
+        if proc.returncode != 0:
+            print(f"Error running NCCL test between {host1} and {host2}: exit code {proc.returncode}")
+            return None
+
+        text = output.decode('utf-8')
 
         # Save full output to log
         with open(NCCL_LOG_FILE, 'a') as log_file:
-            log_file.write(f"\nNCCL output for {host1} and {host2}:\n{output.decode('utf-8')}\n")
+            log_file.write(f"\nNCCL output for {host1} and {host2}:\n{text}\n")
 
-        valid_line = None
-        for line in output.decode('utf-8').split('\n'):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            if "UTC" in line or line.lower().startswith("fri") or "mpi" in line.lower():
-                continue
-
-            columns = line.split()
-            if len(columns) >= 2 and columns[-2].replace('.', '', 1).isdigit():
-                valid_line = line
-                break
-
-        if not valid_line:
+        match = _BW_RE.search(text)
+        if not match:
             print(f"Warning: No valid bandwidth data for {host1} and {host2}. Full output logged.")
             return float(0)
 
-        return float(valid_line.split()[-2])
-    except subprocess.TimeoutExpired:
-        print(f"Error: NCCL test timed out for pair {host1} and {host2}.")
-    except subprocess.CalledProcessError as e:
-        print(f"Error running NCCL test between {host1} and {host2}: {e}")
+        return float(match.group(1))
     except ValueError as e:
         print(f"Error parsing bandwidth output for {host1} and {host2}: {e}")
-    finally:
-        if os.path.exists(hosts_file):
-            os.remove(hosts_file)
     return None
 
 # Display a simple progress bar.
@@ -189,17 +257,13 @@ def print_progress_bar(iteration, total, prefix='', length=50):
     if iteration == total:
         print()
 
-# Global lock for progress updates
-progress_lock = Lock()
-
-# Update progress in the main process
+# Update progress in the main process (everything runs on one event loop, so no lock needed)
 def update_progress(progress_tracker):
-    with progress_lock:
-        progress_tracker['completed'] += 1
-        print_progress_bar(progress_tracker['completed'], progress_tracker['total'], prefix='Testing pairs')
+    progress_tracker['completed'] += 1
+    print_progress_bar(progress_tracker['completed'], progress_tracker['total'], prefix='Testing pairs')
 
 # Retest each bad node by pairing it with a known good node (Sequential with progress bar)
-def retest_bad_nodes_with_progress(bad_nodes, good_nodes, nccl_script, reason="low bandwidth"):
+async def retest_bad_nodes_with_progress(bad_nodes, good_nodes, nccl_script, reason="low bandwidth"):
     if not good_nodes:
         print(f"\n{COLOR_RED}No good nodes available for retesting bad nodes due to {reason}. Retesting with existing bad nodes to find the best.{COLOR_RESET}")
         good_nodes = bad_nodes.copy()  # If no good nodes, try using bad nodes themselves for testing
@@ -223,7 +287,7 @@ def retest_bad_nodes_with_progress(bad_nodes, good_nodes, nccl_script, reason="l
             good_node = next(good_nodes_cycle)  # Pick a different node
 
         print(f"Retesting NCCL test between {good_node} and {node}...", end='')
-        bandwidth = run_nccl_test(good_node, node, nccl_script)
+        bandwidth = await run_nccl_test(good_node, node, nccl_script)
 
         if bandwidth is None:
             print(f"\n{COLOR_RED}Retest failed for {node}. Marking as bad.{COLOR_RESET}")
@@ -235,7 +299,7 @@ def retest_bad_nodes_with_progress(bad_nodes, good_nodes, nccl_script, reason="l
     return retest_results
 
 # Main function to find and report bad nodes based on NCCL test results. (Serial)
-def find_bad_nodes_serial(hosts):
+async def find_bad_nodes_serial(hosts):
     ensure_scripts_executable()
     copy_node_ordering_script()
 
@@ -249,7 +313,7 @@ def find_bad_nodes_serial(hosts):
         host1, host2 = hosts[0], hosts[1]
         print(f"Running NCCL test between: {host1} and {host2}...")
 
-        shape = get_remote_node_shape(host1)
+        shape = await get_remote_node_shape(host1)
         if not shape:
             print(f"Unable to fetch node shape from {host1}. Exiting.")
             return
@@ -258,7 +322,7 @@ def find_bad_nodes_serial(hosts):
         if not gpu_model:
             return
 
-        bandwidth = run_nccl_test(host1, host2, nccl_script, timeout=60)
+        bandwidth = await run_nccl_test(host1, host2, nccl_script, timeout=60)
         if bandwidth is not None:
             color = COLOR_GREEN if bandwidth >= threshold else COLOR_RED
             print(f"\nResult: {host1} <-> {host2}: {color}{bandwidth:.2f} GB/s{COLOR_RESET}")
@@ -272,19 +336,22 @@ def find_bad_nodes_serial(hosts):
         return
 
     print("\nChecking host reachability...")
-    reachable_hosts = check_hosts_concurrently(hosts)
+    reachable_hosts = await check_hosts_concurrently(hosts)
     if len(reachable_hosts) < 2:
         print("Not enough reachable hosts to proceed.")
         return
 
+    print("\nFetching node shapes...")
+    shapes = await get_remote_node_shapes(reachable_hosts)
+
     results = {}
     timeout_nodes = set()
     print("\nRunning NCCL Tests sequentially...")
     total_pairs = len(reachable_hosts) // 2
 
     for i, (host1, host2) in enumerate(zip(reachable_hosts[::2], reachable_hosts[1::2]), 1):
-        shape1 = get_remote_node_shape(host1)
-        shape2 = get_remote_node_shape(host2)
+        shape1 = shapes[host1]
+        shape2 = shapes[host2]
 
         model1, threshold1, script1 = determine_gpu_model(shape1)
         model2, threshold2, script2 = determine_gpu_model(shape2)
@@ -297,7 +364,7 @@ def find_bad_nodes_serial(hosts):
         script = script1 if script1 == script2 else script1
 
         print(f"Running NCCL test between {host1} and {host2}...", end='')
-        bandwidth = run_nccl_test(host1, host2, script)
+        bandwidth = await run_nccl_test(host1, host2, script)
 
         if bandwidth is None:
             timeout_nodes.add(host2)  # Track timeouts
@@ -311,40 +378,43 @@ def find_bad_nodes_serial(hosts):
         last_node = reachable_hosts[-1]
         known_good_node = reachable_hosts[0]  # Use the first good node available
         print(f"\nRunning NCCL test for the last unpaired node: {last_node} with {known_good_node}...", end='')
-        bandwidth = run_nccl_test(known_good_node, last_node, script1)
+        bandwidth = await run_nccl_test(known_good_node, last_node, script1)
         if bandwidth is not None:
             results[(known_good_node, last_node)] = bandwidth
         else:
             timeout_nodes.add(last_node)  # If it fails, mark it as timeout
 
     print("\n\nInitial NCCL Test Results:")
+    good_nodes, bad_nodes = set(), set()
     for (host1, host2), bandwidth in sorted(results.items(), key=lambda x: x[1], reverse=True):
-        threshold = min(determine_gpu_model(get_remote_node_shape(host1))[1],
-                        determine_gpu_model(get_remote_node_shape(host2))[1])
+        threshold = min(determine_gpu_model(shapes[host1])[1],
+                        determine_gpu_model(shapes[host2])[1])
         color = COLOR_GREEN if bandwidth >= threshold else COLOR_RED
         print(f"({host1}, {host2}): {color}{bandwidth:.2f} GB/s{COLOR_RESET}")
 
-    good_nodes = {host for pair, bw in results.items() if bw >= threshold for host in pair}
-    bad_nodes = {host for pair, bw in results.items() if bw < threshold for host in pair}
+        if bandwidth >= threshold:
+            good_nodes.update([host1, host2])
+        else:
+            bad_nodes.update([host1, host2])
 
     # Retest nodes that failed due to timeout.
     timeout_retest_results = {}
     if good_nodes and timeout_nodes:
-        timeout_retest_results = retest_bad_nodes_with_progress(timeout_nodes, good_nodes, script1, reason="timeout")
+        timeout_retest_results = await retest_bad_nodes_with_progress(timeout_nodes, good_nodes, script1, reason="timeout")
         results.update(timeout_retest_results)
 
     # Retest nodes that failed due to low bandwidth.
     low_bw_retest_results = {}
     if good_nodes and bad_nodes:
-        low_bw_retest_results = retest_bad_nodes_with_progress(bad_nodes, good_nodes, script1, reason="low bandwidth")
+        low_bw_retest_results = await retest_bad_nodes_with_progress(bad_nodes, good_nodes, script1, reason="low bandwidth")
         results.update(low_bw_retest_results)
 
     # Retest Summary for Timeout Failures.
     if timeout_retest_results:
         print("\nRetest Results for Timeout Failures:")
         for (good_node, bad_node), bw in timeout_retest_results.items():
-            threshold = min(determine_gpu_model(get_remote_node_shape(good_node))[1],
-                            determine_gpu_model(get_remote_node_shape(bad_node))[1])
+            threshold = min(determine_gpu_model(shapes[good_node])[1],
+                            determine_gpu_model(shapes[bad_node])[1])
             color = COLOR_GREEN if bw >= threshold else COLOR_RED
             print(f"Retest between {good_node} and {bad_node}: {color}{bw:.2f} GB/s{COLOR_RESET}")
 
@@ -352,29 +422,43 @@ def find_bad_nodes_serial(hosts):
     if low_bw_retest_results:
         print("\nRetest Results for Low Bandwidth Failures:")
         for (good_node, bad_node), bw in low_bw_retest_results.items():
-            threshold = min(determine_gpu_model(get_remote_node_shape(good_node))[1],
-                            determine_gpu_model(get_remote_node_shape(bad_node))[1])
+            threshold = min(determine_gpu_model(shapes[good_node])[1],
+                            determine_gpu_model(shapes[bad_node])[1])
             color = COLOR_GREEN if bw >= threshold else COLOR_RED
             print(f"Retest between {good_node} and {bad_node}: {color}{bw:.2f} GB/s{COLOR_RESET}")
 
-    # Finalize Good & Bad Node Lists.
-    final_good_nodes = {host for pair, bw in results.items() if bw >= threshold for host in pair}
-    final_bad_nodes = {host for pair, bw in results.items() if bw < threshold for host in pair}
-    confirmed_bad_nodes = {node for node in final_bad_nodes if node not in final_good_nodes}
+    # Finalize node lists, pair counts, and bandwidth extremes in one pass.
+    final_good_nodes, final_bad_nodes = set(), set()
+    good_pairs = bad_pairs = 0
+    max_bw, min_bw = -math.inf, math.inf
+    for pair, bw in results.items():
+        if bw >= threshold:
+            good_pairs += 1
+            final_good_nodes.update(pair)
+        else:
+            bad_pairs += 1
+            final_bad_nodes.update(pair)
+        if bw > max_bw:
+            max_bw = bw
+        if bw < min_bw:
+            min_bw = bw
+    if not results:
+        max_bw = min_bw = 0.0
+    confirmed_bad_nodes = final_bad_nodes - final_good_nodes
 
     print("\nSummary:")
-    print(f"\nGood Bandwidth Pairs (≥ threshold): {len([bw for bw in results.values() if bw >= threshold])}")
-    print(f"Bad Bandwidth Pairs (< threshold): {len([bw for bw in results.values() if bw < threshold])}")
+    print(f"\nGood Bandwidth Pairs (≥ threshold): {good_pairs}")
+    print(f"Bad Bandwidth Pairs (< threshold): {bad_pairs}")
     print(f"\nTotal Good Nodes: {len(final_good_nodes)}")
     print("   ", ", ".join(sorted(final_good_nodes)))
     print(f"\nTotal Bad Nodes: {len(confirmed_bad_nodes)}")
     print("   ", ", ".join(sorted(confirmed_bad_nodes)))
-    print(f"\nMaximum Bandwidth: {max(results.values()) if results else 0.0} GB/s")
-    print(f"Minimum Bandwidth: {min(results.values()) if results else 0.0} GB/s")
+    print(f"\nMaximum Bandwidth: {max_bw} GB/s")
+    print(f"Minimum Bandwidth: {min_bw} GB/s")
     print("Please perform healtchchecks if there are any bad node(s).")
 
 # Main function to find and report bad nodes based on NCCL test results. (Parallel)
-def find_bad_nodes_parallel(hosts):
+async def find_bad_nodes_parallel(hosts, max_parallel=4):
     ensure_scripts_executable()
     copy_node_ordering_script()
 
@@ -389,7 +473,7 @@ def find_bad_nodes_parallel(hosts):
         host1, host2 = hosts[0], hosts[1]
         print(f"Running NCCL test only between: {host1} and {host2}...")
 
-        shape = get_remote_node_shape(host1)
+        shape = await get_remote_node_shape(host1)
         if not shape:
             print(f"Unable to fetch node shape from {host1}. Exiting.")
             return
@@ -398,7 +482,7 @@ def find_bad_nodes_parallel(hosts):
         if not gpu_model:
             return
 
-        bandwidth = run_nccl_test(host1, host2, nccl_script, timeout=120)
+        bandwidth = await run_nccl_test(host1, host2, nccl_script, timeout=120)
         if bandwidth is not None:
             color = COLOR_GREEN if bandwidth >= threshold else COLOR_RED
             print(f"\nResult: {host1} <-> {host2}: {color}{bandwidth:.2f} GB/s{COLOR_RESET}")
@@ -413,16 +497,20 @@ def find_bad_nodes_parallel(hosts):
 
     # Check host reachability
     print("\nChecking host reachability...")
-    reachable_hosts = check_hosts_concurrently(hosts)
+    reachable_hosts = await check_hosts_concurrently(hosts)
     if len(reachable_hosts) < 2:
         print("Not enough reachable hosts to proceed.")
         return
 
+    # Fetch all node shapes up front
+    print("\nFetching node shapes...")
+    shapes = await get_remote_node_shapes(reachable_hosts)
+
     # Prepare test pairs
     pairs_to_test, thresholds = [], {}
     for host1, host2 in zip(reachable_hosts[::2], reachable_hosts[1::2]):
-        shape1 = get_remote_node_shape(host1)
-        shape2 = get_remote_node_shape(host2)
+        shape1 = shapes[host1]
+        shape2 = shapes[host2]
 
         model1, threshold1, script1 = determine_gpu_model(shape1)
         model2, threshold2, script2 = determine_gpu_model(shape2)
@@ -447,19 +535,23 @@ def find_bad_nodes_parallel(hosts):
     results = {}
     timeout_nodes = set()
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        futures = {executor.submit(run_nccl_test, *pair): pair for pair in pairs_to_test}
+    # The semaphore keeps concurrent NCCL tests from oversubscribing the
+    # RDMA fabric while still letting all pairs overlap on the event loop.
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+    async def run_pair(pair):
+        async with semaphore:
+            return await run_nccl_test(*pair)
 
-        for future in concurrent.futures.as_completed(futures):
-            host1, host2, _ = futures[future]
-            try:
-                bandwidth = future.result()
-                if bandwidth is None:
-                    timeout_nodes.update([host1, host2])  # Track timeout failures
-                else:
-                    results[(host1, host2)] = bandwidth
-            except Exception as e:
-                print(f"Error running NCCL test for pair ({host1}, {host2}): {e}")
+    outcomes = await asyncio.gather(*(run_pair(pair) for pair in pairs_to_test), return_exceptions=True)
+
+    for (host1, host2, _), bandwidth in zip(pairs_to_test, outcomes):
+        if isinstance(bandwidth, Exception):
+            print(f"Error running NCCL test for pair ({host1}, {host2}): {bandwidth}")
+        elif bandwidth is None:
+            timeout_nodes.update([host1, host2])  # Track timeout failures
+        else:
+            results[(host1, host2)] = bandwidth
 
     # Print Initial NCCL Test Results
     print("\n\nInitial NCCL Test Results:")
@@ -477,7 +569,7 @@ def find_bad_nodes_parallel(hosts):
     # Retest nodes that failed due to timeout.
     timeout_retest_results = {}
     if good_nodes and timeout_nodes:
-        timeout_retest_results = retest_bad_nodes_with_progress(timeout_nodes, good_nodes, script1, reason="timeout")
+        timeout_retest_results = await retest_bad_nodes_with_progress(timeout_nodes, good_nodes, script1, reason="timeout")
         results.update(timeout_retest_results)
 
     # Retest nodes that failed due to low bandwidth.
@@ -485,7 +577,7 @@ def find_bad_nodes_parallel(hosts):
     if good_nodes and bad_nodes:
         bad_nodes_for_retest = {node for node in bad_nodes if node not in good_nodes}
         if bad_nodes_for_retest:
-            low_bw_retest_results = retest_bad_nodes_with_progress(bad_nodes_for_retest, good_nodes, script1, reason="low bandwidth")
+            low_bw_retest_results = await retest_bad_nodes_with_progress(bad_nodes_for_retest, good_nodes, script1, reason="low bandwidth")
             results.update(low_bw_retest_results)
 
     # Retest Summary for Timeout Failures.
@@ -504,27 +596,45 @@ def find_bad_nodes_parallel(hosts):
             color = COLOR_GREEN if bw >= threshold else COLOR_RED
             print(f"Retest between {good_node} and {bad_node}: {color}{bw:.2f} GB/s{COLOR_RESET}")
 
-    # Finalize Good & Bad Node Lists.
-    final_good_nodes = {host for pair, bw in results.items() if bw >= thresholds.get(pair, 0) for host in pair}
-    final_bad_nodes = {host for pair, bw in results.items() if bw < thresholds.get(pair, 0) for host in pair}
-    confirmed_bad_nodes = {node for node in final_bad_nodes if node not in final_good_nodes}
+    # Finalize node lists, pair counts, and bandwidth extremes in one pass.
+    floor = min(thresholds.values()) if thresholds else 0
+    final_good_nodes, final_bad_nodes = set(), set()
+    good_pairs = bad_pairs = 0
+    max_bw, min_bw = -math.inf, math.inf
+    for pair, bw in results.items():
+        if bw >= thresholds.get(pair, 0):
+            final_good_nodes.update(pair)
+        else:
+            final_bad_nodes.update(pair)
+        if bw >= floor:
+            good_pairs += 1
+        else:
+            bad_pairs += 1
+        if bw > max_bw:
+            max_bw = bw
+        if bw < min_bw:
+            min_bw = bw
+    if not results:
+        max_bw = min_bw = 0.0
+    confirmed_bad_nodes = final_bad_nodes - final_good_nodes
 
     # Print Summary
     print("\nSummary:")
-    print(f"\nGood Bandwidth Pairs (≥ threshold): {len([bw for bw in results.values() if bw >= min(thresholds.values())])}")
-    print(f"Bad Bandwidth Pairs (< threshold): {len([bw for bw in results.values() if bw < min(thresholds.values())])}")
+    print(f"\nGood Bandwidth Pairs (≥ threshold): {good_pairs}")
+    print(f"Bad Bandwidth Pairs (< threshold): {bad_pairs}")
     print(f"\nTotal Good Nodes: {len(final_good_nodes)}")
     print("   ", ", ".join(sorted(final_good_nodes)))
     print(f"\nTotal Bad Nodes: {len(confirmed_bad_nodes)}")
     print("   ", ", ".join(sorted(confirmed_bad_nodes)))
-    print(f"\nMaximum Bandwidth: {max(results.values()) if results else 0.0} GB/s")
-    print(f"Minimum Bandwidth: {min(results.values()) if results else 0.0} GB/s")
+    print(f"\nMaximum Bandwidth: {max_bw} GB/s")
+    print(f"Minimum Bandwidth: {min_bw} GB/s")
     print("Please perform health checks if there are any bad nodes.")
 
 def main():
     # Argument parsing setup
     parser = argparse.ArgumentParser(description="Find bad nodes in the cluster.")
     parser.add_argument('--parallel', action='store_true', help='Run the node check in parallel')
+    parser.add_argument('--max-parallel', type=int, default=4, help='Maximum number of concurrent NCCL tests when running with --parallel (default: 4)')
     parser.add_argument('hosts', nargs='*', help='Provide a host file or two host names')
 
     # Parse arguments
@@ -532,9 +642,9 @@ def main():
 
     # Call the appropriate function based on --parallel flag
     if args.parallel:
-        find_bad_nodes_parallel(args.hosts)
+        asyncio.run(find_bad_nodes_parallel(args.hosts, max_parallel=args.max_parallel))
     else:
-        find_bad_nodes_serial(args.hosts)
+        asyncio.run(find_bad_nodes_serial(args.hosts))
 
 if __name__ == "__main__":
     main()
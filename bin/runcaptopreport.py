@@ -1,7 +1,11 @@
 #!/usr/bin/python3
 import oci
+import requests
 from datetime import datetime
+from collections import Counter
 import argparse
+import queue
+import threading
 import sys
 
 argparser = argparse.ArgumentParser()
@@ -10,39 +14,64 @@ args = argparser.parse_args()
 
 capacity_topology_id = args.capacity_id
 signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
-computeClient = oci.core.ComputeClient(config={}, signer=signer)
+computeClient = oci.core.ComputeClient(config={}, signer=signer, retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY)
+# Widen the urllib3 pool past its default 10 slots so concurrent calls made
+# through this shared client don't serialize behind the connection pool.
+computeClient.base_client.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
 
 
 count=0
 repair_nodes=[]
 
+# Reported status by (lifecycle_details, has an instance attached).
+# Anything not listed here is reported as-is.
+STATUS_REMAP={
+    ("AVAILABLE", True): "RUNNING",
+    ("AVAILABLE", False): "AVAILABLE",
+    ("UNAVAILABLE", True): "RUNNING",
+    ("UNAVAILABLE", False): "IN_REPAIR",
+    ("DEGRADED", True): "RUNNING",
+    ("DEGRADED", False): "IN_REPAIR",
+}
+
+# Map a bare metal host record to the status we report.
+def classify(node):
+    return STATUS_REMAP.get((node.lifecycle_details, bool(node.instance_id)), node.lifecycle_details)
+
 try:
     print(datetime.now().strftime("%m/%d/%Y %H:%M:%S"))
     print("----------------------\n     Block Status\n----------------------")
-    response=oci.pagination.list_call_get_all_results(computeClient.list_compute_capacity_topology_compute_bare_metal_hosts, capacity_topology_id)
-    state_counts={}
-    for node in response.data:
-        shape=node.instance_shape
-        status=node.lifecycle_details
-        count+=1
-        if status == "AVAILABLE" :
-            if node.instance_id:
-                status="RUNNING"
-            else:
-                status="AVAILABLE"
-
-        if status == "UNAVAILABLE" or status == "DEGRADED" :
-            if node.instance_id:
-                status="RUNNING"
-            else:
-                status="IN_REPAIR"
-                repair_nodes.append(node.id)
+    # Stream the listing page by page so memory stays bounded by the page
+    # size instead of the full topology. A background thread prefetches the
+    # next page while the main thread tallies the current one, overlapping
+    # the per-page round-trip with the Python work.
+    pages=queue.Queue(maxsize=2)
 
-        if status in state_counts.keys():
+    def fetch_pages():
+        try:
+            for page in oci.pagination.list_call_get_all_results_generator(computeClient.list_compute_capacity_topology_compute_bare_metal_hosts, 'response', capacity_topology_id):
+                pages.put(page)
+            pages.put(None)
+        except Exception as e:
+            pages.put(e)
+
+    threading.Thread(target=fetch_pages, daemon=True).start()
+
+    state_counts=Counter()
+    while True:
+        page=pages.get()
+        if page is None:
+            break
+        if isinstance(page, Exception):
+            raise page
+        for node in page.data:
+            shape=node.instance_shape
+            status=classify(node)
             state_counts[status]+=1
-        else:
-            state_counts[status]=1
-    print("State :: "+str(state_counts)+"\n")
+            count+=1
+            if status == "IN_REPAIR":
+                repair_nodes.append(node.id)
+    print("State :: "+str(dict(state_counts))+"\n")
     print("Total ::", count, shape)
 
     if len(repair_nodes) > 0:
@@ -29,12 +29,14 @@ def checktags():
     good_namespace = False
     good_tag = False
     try:
-        tag_namespaces = identity_client.list_tag_namespaces(signer.tenancy_id).data
-        for tagns in tag_namespaces:
+        # Page through every namespace so a miss is authoritative, but stop
+        # fetching as soon as the one we want turns up.
+        for tagns in oci.pagination.list_call_get_all_results_generator(identity_client.list_tag_namespaces, 'record', signer.tenancy_id):
             if tagns.name == "ComputeInstanceHostActions":
                 print(f"\nCorrect Tag Namespace Found...\n")
                 correct_namespace = tagns.id
                 good_namespace = True
+                break
         if not good_namespace:
             print(f"Tags are not set up properly...\n")
             sys.exit(1)
@@ -43,11 +45,11 @@ def checktags():
         sys.exit(1)
 
     try:
-        tags = identity_client.list_tags(correct_namespace).data
-        for tag in tags:
+        for tag in oci.pagination.list_call_get_all_results_generator(identity_client.list_tags, 'record', correct_namespace):
             if tag.name == "CustomerReportedHostStatus":
                 print(f"Correct Tag Found...\n")
                 good_tag = True
+                break
         if not good_tag:
             print(f"Tags are not set up properly...\n")
             sys.exit(1)